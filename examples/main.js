@@ -1,19 +1,35 @@
 const NewspaperScraper = require('../lib/NewspaperScraper');
-const fs = require('fs').promises;
+const fs = require('fs');
 const path = require('path');
 const dotenv = require('dotenv');
 
-// Load environment variables
-dotenv.config();
+// CSV column header and the article field it is read from
+const CSV_COLUMNS = [
+    ['Newspaper title', 'title'],
+    ['Page number', 'pageNumber'],
+    ['Date', 'date'],
+    ['Location', 'location'],
+    ['Number of keyword matches on the page', 'keywordMatches'],
+    ['Viewer URL', 'url']
+];
+
+function csvEscape(value) {
+    const text = value === null || value === undefined ? '' : String(value);
+    return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
 
 async function main() {
+    // Load environment variables
+    dotenv.config();
+
     try {
         // Initialize scraper with all available options
         const scraper = new NewspaperScraper({
             // Core settings
-            concurrentPages: 2,        // Number of pages to scrape simultaneously
+            concurrentPages: Number(process.env.CONCURRENT_PAGES) || 2,              // Result pages fetched per keyword counting batch
             resultsPerPage: 50,        // Number of results per page (max 50)
-            maxConcurrentRequests: 10,  // Max concurrent API requests for keyword counting
+            maxConcurrentRequests: Number(process.env.MAX_CONCURRENT_REQUESTS) || 10, // Max concurrent API requests for keyword counting
+            cacheFile: path.join('output', 'match_cache.jsonl'), // Reuse keyword counts across runs
             
             // Browser configuration
             browser: {
@@ -36,20 +52,35 @@ async function main() {
             }
         });
 
+        // Stream articles to disk as they arrive instead of keeping them in memory.
+        // JSON Lines keeps the file valid even if the run is interrupted.
+        fs.mkdirSync('output', { recursive: true });
+        const jsonOut = fs.createWriteStream(path.join('output', 'articles.jsonl'));
+        const csvOut = fs.createWriteStream(path.join('output', 'articles.csv'));
+        let jsonLines = [];
+        let csvRows = [];
+
+        csvOut.write(CSV_COLUMNS.map(([header]) => header).join(',') + '\n');
+
         // Handle found articles
-        scraper.on('article', async (article) => {
-            // Save each article to a file (optional)
-            await fs.mkdir('output', { recursive: true });
-            const filename = `article_${Date.now()}.json`;
-            await fs.writeFile(
-                path.join('output', filename),
-                JSON.stringify(article, null, 2)
-            );
+        scraper.on('article', (article) => {
+            jsonLines.push(JSON.stringify(article));
+            csvRows.push(CSV_COLUMNS.map(([, field]) => csvEscape(article[field])).join(','));
             console.log(`Found article: ${article.title} (${article.date})`);
         });
 
+        // Write the buffered lines of a batch with a single call per file
+        const flushBatch = () => {
+            if (!csvRows.length) return;
+            jsonOut.write(jsonLines.join('\n') + '\n');
+            csvOut.write(csvRows.join('\n') + '\n');
+            jsonLines = [];
+            csvRows = [];
+        };
+
         // Show progress and stats
         scraper.on('progress', ({current, total, percentage, stats}) => {
+            flushBatch();
             console.log(`Progress: ${percentage.toFixed(2)}% (${current}/${total} pages)`);
             console.log(`Time elapsed: ${stats.timeElapsed.toFixed(2)}s`);
             console.log(`Average time per page: ${stats.avgPageTime.toFixed(2)}s`);
@@ -57,8 +88,11 @@ async function main() {
 
         // Handle completion
         scraper.on('complete', (stats) => {
+            flushBatch();
+            jsonOut.end();
+            csvOut.end();
             console.log('Scraping complete!');
-            console.log(`Total time: ${(stats.timeElapsed / 1000).toFixed(2)} seconds`);
+            console.log(`Total time: ${stats.timeElapsed.toFixed(2)} seconds`);
         });
 
         // Start retrieving with the new API name
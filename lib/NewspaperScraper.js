@@ -19,10 +19,14 @@
 const puppeteerExtra = require('puppeteer-extra');
 const StealthPlugin = require('puppeteer-extra-plugin-stealth');
 const axios = require('axios');
-const pLimit = require('p-limit');
 const { URLSearchParams } = require('url');
 const EventEmitter = require('events');
+const fs = require('fs').promises;
+const dns = require('dns');
+const https = require('https');
+const { HttpsProxyAgent } = require('https-proxy-agent');
 const os = require('os');
+const { performance } = require('perf_hooks');
 
 puppeteerExtra.use(StealthPlugin());
 
@@ -32,6 +36,89 @@ const executablePath = osPlatform.startsWith('win')
     ? "C://Program Files//Google//Chrome//Application//chrome.exe" 
     : "/usr/bin/google-chrome";
 
+// Cache DNS answers for the HTTP agents so repeated connections to the
+// same host (or proxy) skip the lookup on the libuv threadpool
+const DNS_CACHE_TTL = 10 * 60 * 1000;
+const dnsCache = new Map();
+
+function cachedLookup(hostname, options, callback) {
+    if (typeof options === 'function') {
+        callback = options;
+        options = {};
+    }
+
+    // Always cache every address, so callers asking for one address and
+    // callers asking for all of them (autoSelectFamily) share an entry
+    const reply = (addresses) => {
+        if (options.all) {
+            callback(null, addresses);
+        } else {
+            callback(null, addresses[0].address, addresses[0].family);
+        }
+    };
+
+    const key = `${hostname}|${options.family || 0}`;
+    const cached = dnsCache.get(key);
+    if (cached && cached.expires > Date.now()) {
+        process.nextTick(reply, cached.addresses);
+        return;
+    }
+
+    dns.lookup(hostname, { ...options, all: true }, (err, addresses) => {
+        if (err) {
+            callback(err);
+            return;
+        }
+        dnsCache.set(key, { addresses, expires: Date.now() + DNS_CACHE_TTL });
+        reply(addresses);
+    });
+}
+
+// Hits responses are small JSON served directly, so skip decompression
+// and redirect handling for them
+const HITS_REQUEST_OPTIONS = {
+    headers: { 'Accept-Encoding': 'identity' },
+    maxRedirects: 0
+};
+
+// Result batches whose keyword counts may still be running while the
+// next results page is fetched
+const MAX_PENDING_BATCHES = 2;
+
+// Resource types the browser never needs to load
+const BLOCKED_RESOURCE_TYPES = new Set(['image', 'media', 'font', 'stylesheet']);
+
+// Consecutive failures before a proxy port is benched, and for how long
+const PORT_MAX_FAILURES = 3;
+const PORT_BENCH_TIME = 30 * 1000;
+
+// Longest wait between retries, in seconds
+const MAX_BACKOFF = 30;
+
+// Wait before retry number `attempt`: 2^attempt seconds plus up to 1s of
+// jitter, capped at MAX_BACKOFF
+function backoffDelay(attempt) {
+    return Math.min(MAX_BACKOFF, 2 ** attempt + Math.random()) * 1000;
+}
+
+// Paces requests to a fixed rate shared by every task that uses it
+class RateLimiter {
+    constructor(requestsPerSecond) {
+        this.interval = 1000 / requestsPerSecond;
+        this.nextSlot = 0;
+    }
+
+    // Resolves once the caller's request slot has come up
+    async acquire() {
+        const now = Date.now();
+        const wait = this.nextSlot - now;
+        this.nextSlot = Math.max(now, this.nextSlot) + this.interval;
+        if (wait > 0) {
+            await new Promise(resolve => setTimeout(resolve, wait));
+        }
+    }
+}
+
 class NewspaperScraperError extends Error {
     constructor(message) {
         super(message);
@@ -58,9 +145,14 @@ class NewspaperScraper extends EventEmitter {
         super();
         // Default configuration with option to override
         this.config = {
-            concurrentPages: 1,
+            concurrentPages: 1,        // Result pages per keyword count batch
             resultsPerPage: 50,
             maxConcurrentRequests: 20,
+            // Page ids per hits request. Values above 1 assume the endpoint
+            // answers a comma separated list with one hit array per id, in
+            // order; batching is turned off on the first response that doesn't.
+            hitsBatchSize: 1,
+            cacheFile: null,
             browser: {
                 headless: false,
                 userAgent: 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36',
@@ -70,22 +162,53 @@ class NewspaperScraper extends EventEmitter {
                 enabled: false,
                 host: null,
                 port: 9008,
+                ports: null,
                 username: null,
                 password: null,
                 ...options.proxy
             },
+            rateLimit: {
+                search: null,
+                hits: null,
+                ...options.rateLimit
+            },
             logger: {
                 level: 'info',
                 custom: null,
             },
             ...options
         };
+
+        if (!Number.isInteger(this.config.maxConcurrentRequests) || this.config.maxConcurrentRequests < 1) {
+            throw new NewspaperScraperError('maxConcurrentRequests must be a positive integer');
+        }
+        if (!Number.isInteger(this.config.hitsBatchSize) || this.config.hitsBatchSize < 1) {
+            throw new NewspaperScraperError('hitsBatchSize must be a positive integer');
+        }
+
+        // Optional requests-per-second budgets, shared by all concurrent tasks
+        const { search, hits } = this.config.rateLimit;
+        this.searchLimiter = search ? new RateLimiter(search) : null;
+        this.hitsLimiter = hits ? new RateLimiter(hits) : null;
         
         this.stats = {
             startTime: Date.now(),
             pageTimes: []
         };
         this.browser = null;
+        this.httpAgents = [];
+        this.http = null;
+        this.hitsClients = [];
+        this.cookieHeader = '';
+        this.sessionPage = null;
+        this.searchViaBrowser = false;
+
+        // Keyword counts already fetched, keyed by "keyword|pageId".
+        // New entries are appended to config.cacheFile after each batch.
+        this.matchCache = new Map();
+        this.matchCacheLoaded = false;
+        this.pendingCacheLines = [];
+        this.hitsBatchingSupported = true;
     }
 
     log(level, message, ...args) {
@@ -142,6 +265,225 @@ class NewspaperScraper extends EventEmitter {
         });
     }
 
+    // Create a keep-alive HTTP client pinned to one proxy port.
+    // The agent's socket pool also caps how many requests are in flight.
+    createHttpClient(port, maxSockets) {
+        const agentOptions = {
+            keepAlive: true,
+            keepAliveMsecs: 30000,
+            maxSockets,
+            maxFreeSockets: maxSockets,
+            lookup: cachedLookup
+        };
+
+        let agent;
+        if (this.config.proxy.enabled) {
+            const { host, username, password } = this.config.proxy;
+            const auth = username ? `${encodeURIComponent(username)}:${encodeURIComponent(password)}@` : '';
+            agent = new HttpsProxyAgent(`http://${auth}${host}:${port}`, agentOptions);
+        } else {
+            agent = new https.Agent(agentOptions);
+        }
+        this.httpAgents.push(agent);
+
+        // Responses are kept as raw text and parsed once by the caller,
+        // skipping axios' own content sniffing and JSON transform
+        return axios.create({
+            httpsAgent: agent,
+            headers: { 'User-Agent': this.config.browser.userAgent },
+            timeout: 10000,
+            responseType: 'text',
+            transformResponse: [data => data]
+        });
+    }
+
+    // Set up the HTTP clients shared by all API requests. They live as long
+    // as the scraper so later searches reuse the warm connections.
+    setupHttpClient() {
+        if (this.http) return;
+
+        const { enabled, port, ports } = this.config.proxy;
+
+        // Search requests use the browser's proxy port so the Cloudflare
+        // cookies stay valid for the same exit IP. Result pages follow a
+        // cursor and are fetched one at a time, so one socket is enough.
+        this.http = this.createHttpClient(port, 1);
+
+        // Keyword counts rotate over one warm client per proxy port instead
+        // of picking a new upstream per request, so connections get reused.
+        // maxConcurrentRequests is split exactly across the ports (the first
+        // ones take the remainder); ports beyond that count are left unused.
+        const maxRequests = this.config.maxConcurrentRequests;
+        const hitPorts = (enabled && ports?.length ? ports : [port]).slice(0, maxRequests);
+        const baseSockets = Math.floor(maxRequests / hitPorts.length);
+        const extraSockets = maxRequests % hitPorts.length;
+        this.hitsClients = hitPorts.map((hitPort, i) => ({
+            port: hitPort,
+            client: this.createHttpClient(hitPort, baseSockets + (i < extraSockets ? 1 : 0)),
+            inFlight: 0,
+            failures: 0,
+            benchedUntil: 0
+        }));
+        this.nextHitsClient = 0;
+    }
+
+    // Send a hits request over the least busy proxy port. Ports that keep
+    // failing are benched for a while so retries go elsewhere.
+    async requestHits(url) {
+        const now = Date.now();
+        const healthy = this.hitsClients.filter(entry => entry.benchedUntil <= now);
+        const candidates = healthy.length ? healthy : this.hitsClients;
+
+        // Start the scan at a rotating offset so ties are spread round-robin
+        let entry = null;
+        for (let i = 0; i < candidates.length; i++) {
+            const candidate = candidates[(this.nextHitsClient + i) % candidates.length];
+            if (!entry || candidate.inFlight < entry.inFlight) entry = candidate;
+        }
+        this.nextHitsClient = (this.nextHitsClient + 1) % this.hitsClients.length;
+
+        entry.inFlight++;
+        try {
+            const response = await entry.client.get(url, HITS_REQUEST_OPTIONS);
+            entry.failures = 0;
+            return response;
+        } catch (e) {
+            // A 4xx (other than rate limiting) is the request's fault, not the port's
+            const status = e.response?.status;
+            if (status >= 400 && status < 500 && status !== 429) throw e;
+
+            if (++entry.failures >= PORT_MAX_FAILURES && this.hitsClients.length > 1) {
+                entry.failures = 0;
+                entry.benchedUntil = Date.now() + PORT_BENCH_TIME;
+                this.log('warn', `Proxy port ${entry.port} keeps failing, benching it for ${PORT_BENCH_TIME / 1000}s`);
+            }
+            throw e;
+        } finally {
+            entry.inFlight--;
+        }
+    }
+
+    // Resolve the host the HTTP clients connect to (the proxy, if enabled)
+    // once up front, so the first requests don't each wait on DNS
+    async warmDnsCache() {
+        const host = this.config.proxy.enabled ? this.config.proxy.host : 'www.newspapers.com';
+        await new Promise(resolve => cachedLookup(host, {}, (err) => {
+            if (err) this.log('warn', `Failed to resolve ${host}:`, err.message);
+            resolve();
+        }));
+    }
+
+    // Load newspapers.com once in the browser to pass any Cloudflare check,
+    // then reuse its cookies for plain HTTP requests to the JSON API.
+    // The page stays open as a fallback for requests the challenge blocks.
+    async bootstrapSession() {
+        if (this.sessionPage) {
+            await this.sessionPage.close().catch(() => {});
+            this.sessionPage = null;
+        }
+
+        const page = await this.createPage();
+        try {
+            this.log('info', 'Bootstrapping session cookies');
+            const response = await page.goto('https://www.newspapers.com/search/', { waitUntil: 'networkidle2' });
+
+            // Cloudflare serves its challenge with a 403/503 status, so only
+            // look at the page itself when the status says so
+            const status = response?.status();
+            if ((status === 403 || status === 503 || response?.headers()['cf-mitigated'] === 'challenge')
+                && (await page.title()).includes('Just a moment')) {
+                throw new CloudflareError();
+            }
+
+            const cookies = await page.cookies('https://www.newspapers.com');
+            this.cookieHeader = cookies.map(cookie => `${cookie.name}=${cookie.value}`).join('; ');
+            this.sessionPage = page;
+            this.searchViaBrowser = false;
+        } catch (e) {
+            await page.close().catch(() => {});
+            throw e;
+        }
+    }
+
+    // Fetch one page of search results from the JSON API
+    async fetchSearchResults(query) {
+        const url = `https://www.newspapers.com/api/search/query?${query}`;
+        await this.searchLimiter?.acquire();
+
+        // Plain HTTP was already challenged this session, don't pay for
+        // another rejected round trip on every page
+        if (this.searchViaBrowser && this.sessionPage) {
+            return this.fetchSearchResultsInBrowser(url);
+        }
+
+        let response;
+        try {
+            response = await this.http.get(url, {
+                headers: { Accept: 'application/json', Cookie: this.cookieHeader },
+                timeout: 30000,
+                validateStatus: () => true
+            });
+        } catch (e) {
+            // Resets and timeouts (e.g. the server closing an idle keep-alive
+            // socket) are transient, let the caller's backoff retry them
+            if (!e.response || e.code === 'ECONNABORTED' || e.code === 'ETIMEDOUT') {
+                throw new RetryableError(`Search request failed: ${e.code || e.message}`);
+            }
+            throw e;
+        }
+
+        try {
+            return this.parseSearchResponse(response.status, response.headers['content-type'], response.data);
+        } catch (e) {
+            if (!(e instanceof CloudflareError) || !this.sessionPage) throw e;
+        }
+
+        // Blocked over plain HTTP: retry with fetch() inside the bootstrapped
+        // page, and keep doing so until the next bootstrap
+        this.log('debug', 'Search request challenged, switching to the browser session');
+        this.searchViaBrowser = true;
+        return this.fetchSearchResultsInBrowser(url);
+    }
+
+    // Fetch search results with fetch() inside the bootstrapped page, which
+    // shares the browser's cookies without loading a new page
+    async fetchSearchResultsInBrowser(url) {
+        let browserResponse;
+        try {
+            browserResponse = await this.sessionPage.evaluate(async (url) => {
+                const res = await fetch(url, { credentials: 'include', headers: { Accept: 'application/json' } });
+                return { status: res.status, contentType: res.headers.get('content-type'), body: await res.text() };
+            }, url);
+        } catch (e) {
+            // The challenge page may navigate away mid-fetch; retry with a
+            // fresh bootstrap rather than aborting the scrape
+            this.log('debug', 'Browser session fetch failed:', e.message);
+            throw new CloudflareError();
+        }
+
+        return this.parseSearchResponse(browserResponse.status, browserResponse.contentType, browserResponse.body);
+    }
+
+    // Turn a raw search API response into its JSON payload
+    parseSearchResponse(status, contentType, body) {
+        // Cloudflare answers with an HTML challenge instead of JSON. Some
+        // challenge pages come without a content type, so also sniff the body.
+        if (status === 403 || status === 503 || (contentType || '').includes('text/html')
+            || (!contentType && /^\s*</.test(body))) {
+            throw new CloudflareError();
+        }
+
+        if (status !== 200) {
+            throw new RetryableError(`Search request failed with status ${status}`);
+        }
+
+        try {
+            return JSON.parse(body);
+        } catch (e) {
+            throw new RetryableError(`Invalid JSON in search response: ${e.message}`);
+        }
+    }
+
     // Add a helper method to create authenticated pages
     async createPage() {
         const page = await this.browser.newPage();
@@ -151,14 +493,24 @@ class NewspaperScraper extends EventEmitter {
                 password: this.config.proxy.password
             });
         }
+
+        // Only the cookies matter, so don't pull static assets through the proxy
+        await page.setRequestInterception(true);
+        page.on('request', (request) => {
+            if (BLOCKED_RESOURCE_TYPES.has(request.resourceType())) {
+                request.abort().catch(() => {});
+            } else {
+                request.continue().catch(() => {});
+            }
+        });
         return page;
     }
 
-    // Build search parameters
+    // Build the search parameters shared by every results page. The start
+    // cursor is the only per-page parameter and is added by the caller.
     buildSearchParams(keyword, date, location) {
         const params = {
             keyword,
-            start: "*",
             "entity-types": "page,obituary,marriage,birth,enslavement",
             product: "1",
             sort: "score-desc",
@@ -196,46 +548,152 @@ class NewspaperScraper extends EventEmitter {
         return params;
     }
 
+    // Load keyword counts saved by previous runs, one JSON array per line
+    async loadMatchCache() {
+        if (this.matchCacheLoaded || !this.config.cacheFile) return;
+        this.matchCacheLoaded = true;
+
+        let content;
+        try {
+            content = await fs.readFile(this.config.cacheFile, 'utf8');
+        } catch (e) {
+            if (e.code === 'ENOENT') return;
+            throw e;
+        }
+
+        const lines = content.split('\n').filter(Boolean);
+
+        // Start new entries on a fresh line after a truncated last write
+        if (content && !content.endsWith('\n')) {
+            this.pendingCacheLines.push('');
+        }
+
+        // Parse the file in one call, going line by line only if some line
+        // is not valid JSON (e.g. a write cut short by a crash)
+        let entries;
+        try {
+            entries = JSON.parse(`[${lines.join(',')}]`);
+        } catch (e) {
+            entries = [];
+            for (const line of lines) {
+                try {
+                    entries.push(JSON.parse(line));
+                } catch (err) {
+                    this.log('debug', 'Skipping malformed cache line:', line);
+                }
+            }
+        }
+
+        // Lines can be valid JSON without being a cache entry
+        for (const entry of entries) {
+            if (!Array.isArray(entry) || entry.length !== 3) {
+                this.log('debug', 'Skipping malformed cache entry:', entry);
+                continue;
+            }
+            const [keyword, pageId, count] = entry;
+            this.matchCache.set(`${keyword}|${pageId}`, count);
+        }
+        this.log('info', `Loaded ${this.matchCache.size} cached keyword counts`);
+    }
+
+    // Remember a fetched count and queue it for the cache file
+    cacheMatchCount(keyword, pageId, count) {
+        this.matchCache.set(`${keyword}|${pageId}`, count);
+        if (this.config.cacheFile) {
+            this.pendingCacheLines.push(JSON.stringify([keyword, pageId, count]));
+        }
+    }
+
+    // Append the counts fetched since the last flush to the cache file
+    async flushMatchCache() {
+        if (!this.pendingCacheLines.length) return;
+        const lines = this.pendingCacheLines.join('\n') + '\n';
+        this.pendingCacheLines = [];
+        await fs.appendFile(this.config.cacheFile, lines).catch(e => {
+            this.log('warn', 'Failed to write keyword count cache:', e.message);
+        });
+    }
+
     // Count keywords on a single page
     async countKeywordOnSinglePage(pageId, keyword, maxRetries = 5) {
+        const cacheKey = `${keyword}|${pageId}`;
+        if (this.matchCache.has(cacheKey)) {
+            return [pageId, this.matchCache.get(cacheKey)];
+        }
+
         const url = `https://www.newspapers.com/api/search/hits?images=${pageId}&terms=${keyword}`;
-        const headers = { 'User-Agent': this.config.browser.userAgent };
         
         for (let attempt = 0; attempt < maxRetries; attempt++) {
             try {
-                const response = await axios.get(url, { headers, timeout: 10000 });
-                if (Array.isArray(response.data?.[0])) {
-                    return [pageId, response.data[0].length];
+                await this.hitsLimiter?.acquire();
+                const response = await this.requestHits(url);
+
+                // Pages without hits come back as "[[]...", no need to parse them
+                if (response.data.startsWith('[[]')) {
+                    this.cacheMatchCount(keyword, pageId, 0);
+                    return [pageId, 0];
+                }
+
+                const hits = JSON.parse(response.data)?.[0];
+                if (Array.isArray(hits)) {
+                    this.cacheMatchCount(keyword, pageId, hits.length);
+                    return [pageId, hits.length];
                 }
+                this.log('debug', `Unexpected hits response for page ${pageId}:`, response.data.slice(0, 200));
                 return [pageId, "ERROR"];
             } catch (e) {
                 if (attempt < maxRetries - 1) {
-                    await new Promise(resolve => setTimeout(resolve, 1000 + Math.random() * 2000));
+                    await new Promise(resolve => setTimeout(resolve, backoffDelay(attempt)));
                 }
             }
         }
         return [pageId, "ERROR"];
     }
 
+    // Count keywords on several pages with one request. Falls back to one
+    // request per page if the hits endpoint doesn't answer per page id.
+    async countKeywordOnPageBatch(pageIds, keyword) {
+        const uncachedIds = pageIds.filter(pageId => !this.matchCache.has(`${keyword}|${pageId}`));
+
+        if (uncachedIds.length > 1 && this.hitsBatchingSupported) {
+            const url = `https://www.newspapers.com/api/search/hits?images=${uncachedIds.join(',')}&terms=${keyword}`;
+            try {
+                await this.hitsLimiter?.acquire();
+                const response = await this.requestHits(url);
+                const data = JSON.parse(response.data);
+
+                if (Array.isArray(data) && data.length === uncachedIds.length && data.every(Array.isArray)) {
+                    uncachedIds.forEach((pageId, i) => this.cacheMatchCount(keyword, pageId, data[i].length));
+                } else {
+                    this.log('warn', 'Hits endpoint does not support multiple page ids, counting pages one by one');
+                    this.hitsBatchingSupported = false;
+                }
+            } catch (e) {
+                // A rejected request won't get better on the next batch
+                const status = e.response?.status;
+                if (status >= 400 && status < 500 && status !== 429) {
+                    this.log('warn', `Hits endpoint rejected multiple page ids (status ${status}), counting pages one by one`);
+                    this.hitsBatchingSupported = false;
+                } else {
+                    this.log('debug', `Batched keyword count failed: ${e.message}`);
+                }
+            }
+        }
+
+        // Answered from the cache when the batch succeeded
+        return Promise.all(pageIds.map(pageId => this.countKeywordOnSinglePage(pageId, keyword)));
+    }
+
     // Scrape a single search results page
-    async scrapeSinglePage(pageNum, params, keyword) {
+    async scrapeSinglePage(pageNum, query) {
         let retries = 0;
         const maxRetries = 3;
-        let page = null;
 
         while (retries < maxRetries) {
             try {
-                page = await this.createPage();
-                const url = `https://www.newspapers.com/api/search/query?${new URLSearchParams(params)}`;
                 this.log('info', `Fetching search results page ${pageNum} (Attempt ${retries + 1}/${maxRetries})`);
 
-                const response = await page.goto(url, { waitUntil: 'networkidle2' });
-
-                if (await page.$('text="Verifying you are human"')) {
-                    throw new CloudflareError();
-                }
-
-                const result = await response.json();
+                const result = await this.fetchSearchResults(query);
                 const records = result.records || [];
 
                 if (!records.length) {
@@ -244,9 +702,8 @@ class NewspaperScraper extends EventEmitter {
 
                 this.log('info', `Page ${pageNum} received ${records.length} records.`);
 
-                const recordsWithMatches = await this.countKeywordsOnAllPages(records, keyword);
                 return {
-                    records_with_matches: recordsWithMatches,
+                    records: records.map(record => this.normalizeRecord(record)),
                     recordCount: result.recordCount || 0,
                     nextStart: result.nextStart
                 };
@@ -255,29 +712,54 @@ class NewspaperScraper extends EventEmitter {
                 this.log('error', `Error on attempt ${retries + 1}:`, e.message);
                 retries++;
 
-                // Always close the page after an error
-                if (page) {
-                    await page.close().catch(() => {});
-                    page = null;
-                }
-
                 // If we have retries left and it's a retryable error, wait and try again
                 if (retries < maxRetries && (e instanceof RetryableError || e instanceof CloudflareError)) {
-                    await new Promise(resolve => setTimeout(resolve, Math.random() * 3000 + 2000));
+                    await new Promise(resolve => setTimeout(resolve, backoffDelay(retries)));
+
+                    // Cookies were rejected, pass the challenge again in the browser
+                    if (e instanceof CloudflareError) {
+                        await this.bootstrapSession().catch(err => {
+                            this.log('warn', 'Failed to refresh session cookies:', err.message);
+                        });
+                    }
                     continue;
                 }
 
                 // If it's not retryable or we're out of retries, give up
                 this.log('error', `Failed to fetch page ${pageNum} after ${retries} attempts.`);
                 throw e;
-            } finally {
-                if (page) {
-                    await page.close().catch(() => {});
-                }
             }
         }
     }
 
+    // Flatten a raw search record to the fields the scraper uses, dropping
+    // the rest of the payload as soon as a page is received
+    normalizeRecord(record) {
+        const page = record.page ?? {};
+        const publication = record.publication ?? {};
+        return {
+            pageId: page.id,
+            title: publication.name,
+            pageNumber: page.pageNumber,
+            date: page.date,
+            location: publication.location,
+            keywordMatches: undefined,
+            url: page.viewerUrl
+        };
+    }
+
+    // Map a normalized record to the emitted article shape
+    formatArticle(record) {
+        return {
+            title: record.title,
+            pageNumber: record.pageNumber,
+            date: record.date,
+            location: record.location,
+            keywordMatches: record.keywordMatches,
+            url: record.url
+        };
+    }
+
     // Main scraping method
     async scrapeNewspapers(keyword, maxPages = null, date = null, location = null) {
         if (!keyword || typeof keyword !== 'string') {
@@ -294,106 +776,200 @@ class NewspaperScraper extends EventEmitter {
 
         this.log('info', `Starting newspaper scraping for keyword: '${keyword}', date: ${date}, location: ${location}`);
         
+        // Timing covers this run only, the scraper may be reused. Durations
+        // use the monotonic clock; running totals keep the average page time
+        // O(1) per progress event.
+        this.stats = {
+            startTime: Date.now(),
+            pageTimes: []
+        };
+        this.startedAt = performance.now();
+        this.totalBatchTime = 0;
+        this.timedPages = 0;
+
+        let pendingBatch = null;
+        const pendingBatches = [];
         try {
             await this.setupBrowser();
-            const params = this.buildSearchParams(keyword, date, location);
+            this.setupHttpClient();
+            await Promise.all([this.warmDnsCache(), this.loadMatchCache()]);
+            await this.bootstrapSession().catch(e => {
+                this.log('warn', 'Failed to bootstrap session cookies:', e.message);
+            });
+            // Only the start cursor changes between pages, so encode the
+            // rest of the query string once
+            const baseQuery = new URLSearchParams(this.buildSearchParams(keyword, date, location)).toString();
+            let cursor = '*';
             let pageCount = 0;
-            let totalPages = 1;
+            let totalPages = null;
+            let hasMore = true;
 
-            while (true) {
-                const batchStartTime = Date.now();
-                const tasks = [];
+            while (hasMore) {
+                const batchStartTime = performance.now();
+                const batchResults = [];
 
+                // The search API is cursor based: every page's start value comes
+                // from the previous response, so pages are fetched one after the
+                // other. Requesting several pages with the same cursor would only
+                // return the same page again.
                 for (let i = 0; i < this.config.concurrentPages; i++) {
                     if (maxPages && pageCount >= maxPages) break;
-                    tasks.push(this.scrapeSinglePage(pageCount + 1, params, keyword));
-                    pageCount++;
-                }
+                    if (totalPages !== null && pageCount >= totalPages) break;
 
-                const batchResults = await Promise.all(tasks);
-                this.stats.pageTimes.push((Date.now() - batchStartTime) / 1000 / tasks.length);
-
-                const validResults = batchResults.filter(result => result !== null);
-                if (!validResults.length) break;
-
-                for (const result of validResults) {
-                    // Emit each article as it's found
-                    for (const article of result.records_with_matches) {
-                        const formattedArticle = {
-                            title: article.publication.name,
-                            pageNumber: article.page.pageNumber,
-                            date: article.page.date,
-                            location: article.publication.location,
-                            keywordMatches: article.keyword_match_count,
-                            url: article.page.viewerUrl
-                        };
-                        
-                        this.emit('article', formattedArticle);
-                    }
+                    const result = await this.scrapeSinglePage(pageCount + 1, `start=${encodeURIComponent(cursor)}&${baseQuery}`);
+                    pageCount++;
+                    batchResults.push(result);
+                    totalPages = Math.ceil(result.recordCount / this.config.resultsPerPage);
 
-                    if (result.nextStart) {
-                        params.start = result.nextStart;
+                    if (!result.nextStart) {
+                        hasMore = false;
+                        break;
                     }
+                    cursor = result.nextStart;
                 }
 
-                if (validResults[0]) {
-                    totalPages = Math.ceil(validResults[0].recordCount / this.config.resultsPerPage);
-                    
-                    // Emit progress
-                    this.emit('progress', {
-                        current: pageCount,
-                        total: totalPages,
-                        percentage: (pageCount/totalPages) * 100,
-                        stats: {
-                            timeElapsed: (Date.now() - this.stats.startTime) / 1000,
-                            avgPageTime: this.stats.pageTimes.reduce((a, b) => a + b) / this.stats.pageTimes.length
-                        }
-                    });
+                if (!batchResults.length) break;
+
+                // Count keywords for this batch in the background while the
+                // next results page is fetched. Batches still emit in order.
+                pendingBatch = this.processBatch({
+                    records: batchResults.flatMap(result => result.records),
+                    keyword,
+                    batchStartTime,
+                    pages: batchResults.length,
+                    current: pageCount,
+                    total: totalPages,
+                    previous: pendingBatch
+                });
+                // Handled when awaited by the next batch or below
+                pendingBatch.catch(() => {});
+
+                // Don't let result fetching run arbitrarily far ahead of
+                // keyword counting, which would pile up records and requests
+                pendingBatches.push(pendingBatch);
+                while (pendingBatches.length > MAX_PENDING_BATCHES) {
+                    await pendingBatches.shift();
                 }
 
                 if ((maxPages && pageCount >= maxPages) || pageCount >= totalPages) {
                     break;
                 }
             }
+
+            await pendingBatch;
         } finally {
+            // Don't leave keyword counts running if fetching results failed
+            await pendingBatch?.catch(() => {});
             if (this.browser) {
                 await this.browser.close();
             }
+            this.sessionPage = null;
+            this.stats.timeElapsed = (performance.now() - this.startedAt) / 1000;
             this.emit('complete', this.stats);
         }
     }
 
+    // Count keywords for one batch of search results, then emit its articles
+    // and progress once the previous batch has been emitted
+    async processBatch({ records, keyword, batchStartTime, pages, current, total, previous }) {
+        // One fan-out for every record of the batch, so one slow page
+        // doesn't hold back the others
+        await this.countKeywordsOnAllPages(records, keyword);
+
+        // Measured before waiting on the previous batch, which overlaps
+        const batchTime = (performance.now() - batchStartTime) / 1000;
+        this.stats.pageTimes.push(batchTime / pages);
+        this.totalBatchTime += batchTime;
+        this.timedPages += pages;
+
+        await previous;
+        await this.flushMatchCache();
+
+        // Emit each article as it's found
+        for (const record of records) {
+            this.emit('article', this.formatArticle(record));
+        }
+
+        this.emit('progress', {
+            current,
+            total,
+            percentage: (current / total) * 100,
+            stats: {
+                timeElapsed: (performance.now() - this.startedAt) / 1000,
+                avgPageTime: this.totalBatchTime / this.timedPages
+            }
+        });
+    }
+
     // Cleanup method
     async close() {
         if (this.browser) {
             await this.browser.close();
             this.browser = null;
         }
+        this.httpAgents.forEach(agent => agent.destroy());
+        this.httpAgents = [];
+        this.http = null;
+        this.hitsClients = [];
     }
 
     // Move this inside the class
     async countKeywordsOnAllPages(searchResults, keyword) {
         this.log('info', `Processing ${searchResults.length} pages for keyword counts`);
 
-        const limit = pLimit(this.config.maxConcurrentRequests);
-        
-        const counts = await Promise.all(
-            searchResults
-                .filter(record => record.page?.id)
-                .map(record => 
-                    // Now we can use this.countKeywordOnSinglePage
-                    limit(() => this.countKeywordOnSinglePage(record.page.id, keyword))
-                )
-        );
+        // Records from several result pages can share a page id; fetch each
+        // id once and fan the count out to every record that has it
+        const recordsById = new Map();
+        for (const record of searchResults) {
+            const pageId = record.pageId;
+            if (!pageId) {
+                // Nothing to look up, mark it failed without a request
+                record.keywordMatches = "ERROR";
+                continue;
+            }
+            if (!recordsById.has(pageId)) recordsById.set(pageId, []);
+            recordsById.get(pageId).push(record);
+        }
+        const pageIds = [...recordsById.keys()];
+
+        if (pageIds.length < searchResults.length) {
+            this.log('debug', `Counting ${pageIds.length} unique pages for ${searchResults.length} records`);
+        }
+
+        const batches = [];
+        for (let i = 0; i < pageIds.length; i += this.config.hitsBatchSize) {
+            batches.push(pageIds.slice(i, i + this.config.hitsBatchSize));
+        }
 
         let successCount = 0;
-        counts.forEach(([pageId, count]) => {
-            const record = searchResults.find(r => r.page?.id === pageId);
-            if (record) {
-                record.keyword_match_count = count;
-                if (count !== "ERROR") successCount++;
+        const assignCounts = (counts) => {
+            for (const [pageId, count] of counts) {
+                const records = recordsById.get(pageId);
+                for (const record of records) {
+                    record.keywordMatches = count;
+                }
+                if (count !== "ERROR") successCount += records.length;
             }
-        });
+        };
+
+        // Concurrency is bounded by the HTTP agent's maxSockets. Counts are
+        // written to their records as each batch lands, and a failing batch
+        // only marks its own pages as errors instead of failing them all.
+        let failedBatches = 0;
+        let firstFailure = null;
+        await Promise.all(batches.map(batch =>
+            this.countKeywordOnPageBatch(batch, keyword)
+                .then(assignCounts)
+                .catch(e => {
+                    failedBatches++;
+                    firstFailure = firstFailure || e;
+                    assignCounts(batch.map(pageId => [pageId, "ERROR"]));
+                })
+        ));
+
+        if (failedBatches) {
+            this.log('warn', `${failedBatches} keyword count batch(es) failed:`, firstFailure?.message);
+        }
 
         const successRate = (successCount / searchResults.length) * 100;
         this.log('info', `Finished counting keywords on all pages. Success rate: ${successRate.toFixed(2)}%`);